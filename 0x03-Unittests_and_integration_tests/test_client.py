@@ -1,77 +1,81 @@
 #!/usr/bin/env python3
 """Test module for client.GithubOrgClient class"""
 import unittest
-from parameterized import parameterized, parameterized_class
-from unittest.mock import patch, PropertyMock, Mock
+from types import SimpleNamespace
+import pytest
+from parameterized import parameterized_class
+from unittest.mock import patch, PropertyMock
 from client import GithubOrgClient
 from fixtures import TEST_PAYLOAD
 
+_HAS_LICENSE_CASES = [
+    ({"license": {"key": "my_license"}}, "my_license", True),
+    ({"license": {"key": "other_license"}}, "my_license", False),
+]
 
-class TestGithubOrgClient(unittest.TestCase):
-    """Test class for GithubOrgClient unit tests"""
-
-    @parameterized.expand([
-        ("google",),
-        ("abc",),
-    ])
-    @patch('client.get_json')
-    def test_org(self, org_name, mock_get_json):
-        """Test GithubOrgClient.org returns correct value"""
-        expected_response = {"login": org_name, "id": 123456}
-        mock_get_json.return_value = expected_response
-
-        client = GithubOrgClient(org_name)
-        result = client.org
-
-        mock_get_json.assert_called_once_with(
-            f"https://api.github.com/orgs/{org_name}"
-        )
-        self.assertEqual(result, expected_response)
-
-    def test_public_repos_url(self):
-        """Test that _public_repos_url returns correct URL"""
-        test_payload = {"repos_url": "https://api.github.com/orgs/test/repos"}
-
-        with patch(
-                'client.GithubOrgClient.org',
-                new_callable=PropertyMock,
-                return_value=test_payload) as mock_org:
-            client = GithubOrgClient("test")
-            result = client._public_repos_url
-
-            self.assertEqual(result, test_payload["repos_url"])
-            mock_org.assert_called_once()
-
-    @patch('client.get_json')
-    def test_public_repos(self, mock_get_json):
-        """Test that public_repos returns expected repos"""
-        test_payload = [
-            {"name": "repo1", "license": {"key": "mit"}},
-            {"name": "repo2", "license": {"key": "apache-2.0"}},
-        ]
-        mock_get_json.return_value = test_payload
-
-        test_url = "https://api.github.com/orgs/test/repos"
-        with patch(
-                'client.GithubOrgClient._public_repos_url',
-                new_callable=PropertyMock,
-                return_value=test_url) as mock_url:
-            client = GithubOrgClient("test")
-            result = client.public_repos()
-
-            self.assertEqual(result, ["repo1", "repo2"])
-            mock_get_json.assert_called_once_with(test_url)
-            mock_url.assert_called_once()
-
-    @parameterized.expand([
-        ({"license": {"key": "my_license"}}, "my_license", True),
-        ({"license": {"key": "other_license"}}, "my_license", False),
-    ])
-    def test_has_license(self, repo, license_key, expected):
-        """Test that has_license returns the correct boolean"""
-        client = GithubOrgClient("test")
-        result = client.has_license(repo, license_key)
-        self.assertEqual(result, expected)
+@pytest.fixture
+def mock_get_json():
+    """Patch client.get_json for a single unit test"""
+    with patch('client.get_json') as mock:
+        yield mock
+
+
+@pytest.mark.parametrize("org_name", ["google", "abc"])
+def test_org(org_name, mock_get_json):
+    """Test GithubOrgClient.org returns correct value"""
+    expected_response = {"login": org_name, "id": 123456}
+    mock_get_json.return_value = expected_response
+
+    client = GithubOrgClient(org_name)
+    result = client.org
+    assert client.org is result
+
+    mock_get_json.assert_called_once_with(
+        f"https://api.github.com/orgs/{org_name}"
+    )
+    assert result == expected_response
+
+
+@pytest.mark.parametrize("org_name, repos_url", [
+    ("google", "https://api.github.com/orgs/google/repos"),
+    ("abc", "https://api.github.com/orgs/abc/repos"),
+])
+def test_public_repos_url(org_name, repos_url):
+    """Test that _public_repos_url returns correct URL"""
+    test_payload = {"repos_url": repos_url}
+
+    with patch('client.GithubOrgClient.org',
+               new_callable=PropertyMock) as mock_org:
+        mock_org.return_value = test_payload
+        result = GithubOrgClient(org_name)._public_repos_url
+
+        assert result == test_payload["repos_url"]
+        mock_org.assert_called_once()
+
+
+def test_public_repos(mock_get_json):
+    """Test that public_repos returns expected repos"""
+    test_payload = [
+        {"name": "repo1", "license": {"key": "mit"}},
+        {"name": "repo2", "license": {"key": "apache-2.0"}},
+    ]
+    mock_get_json.return_value = test_payload
+
+    test_url = "https://api.github.com/orgs/test/repos"
+    with patch('client.GithubOrgClient._public_repos_url',
+               new_callable=PropertyMock) as mock_url:
+        mock_url.return_value = test_url
+        result = GithubOrgClient("test").public_repos()
+
+        assert result == ["repo1", "repo2"]
+        mock_get_json.assert_called_once_with(test_url)
+        mock_url.assert_called_once()
+
+
+@pytest.mark.parametrize("repo, license_key, expected", _HAS_LICENSE_CASES)
+def test_has_license(repo, license_key, expected):
+    """Test that has_license returns the correct boolean"""
+    assert GithubOrgClient("test").has_license(repo, license_key) == expected
 
 
 @parameterized_class([
@@ -94,9 +98,9 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
         def side_effect(url):
             """Side effect to return different payloads based on URL"""
             if url.endswith("/orgs/google"):
-                return Mock(json=lambda: cls.org_payload)
+                return SimpleNamespace(json=lambda: cls.org_payload)
             if url.endswith("/orgs/google/repos"):
-                return Mock(json=lambda: cls.repos_payload)
+                return SimpleNamespace(json=lambda: cls.repos_payload)
             return None
 
         cls.mock_get.side_effect = side_effect
@@ -120,4 +124,4 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
@@ -1,26 +1,30 @@
 #!/usr/bin/env python3
 """Unit tests for utils module"""
 import unittest
+import responses
 from parameterized import parameterized
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 from utils import access_nested_map, get_json, memoize
 
+_NESTED_MAP_CASES = [
+    ({"a": 1}, ("a",), 1),
+    ({"a": {"b": 2}}, ("a",), {"b": 2}),
+    ({"a": {"b": 2}}, ("a", "b"), 2),
+]
+_NESTED_MAP_ERROR_CASES = [
+    ({}, ("a",), "'a'"),
+    ({"a": 1}, ("a", "b"), "'b'"),
+]
+
 
 class TestAccessNestedMap(unittest.TestCase):
     """Test class for access_nested_map function"""
-    @parameterized.expand([
-        ({"a": 1}, ("a",), 1),
-        ({"a": {"b": 2}}, ("a",), {"b": 2}),
-        ({"a": {"b": 2}}, ("a", "b"), 2),
-    ])
+    @parameterized.expand(_NESTED_MAP_CASES)
     def test_access_nested_map(self, nested_map, path, expected):
         """Test that access_nested_map returns the expected result"""
         self.assertEqual(access_nested_map(nested_map, path), expected)
 
-    @parameterized.expand([
-        ({}, ("a",), "'a'"),
-        ({"a": 1}, ("a", "b"), "'b'"),
-    ])
+    @parameterized.expand(_NESTED_MAP_ERROR_CASES)
     def test_access_nested_map_exception(self, nested_map, path, expected_msg):
         """Test that access_nested_map raises KeyError with message"""
         with self.assertRaises(KeyError) as cm:
@@ -34,15 +38,14 @@ class TestGetJson(unittest.TestCase):
         ("http://example.com", {"payload": True}),
         ("http://holberton.io", {"payload": False}),
     ])
+    @responses.activate
     def test_get_json(self, test_url, test_payload):
         """Test get_json returns expected result without HTTP calls"""
-        mock_response = Mock()
-        mock_response.json.return_value = test_payload
+        responses.add(responses.GET, test_url, json=test_payload, status=200)
 
-        with patch('requests.get', return_value=mock_response) as mock_get:
-            result = get_json(test_url)
-            mock_get.assert_called_once_with(test_url)
-            self.assertEqual(result, test_payload)
+        result = get_json(test_url)
+        responses.assert_call_count(test_url, 1)
+        self.assertEqual(result, test_payload)
 
 
 class TestMemoize(unittest.TestCase):
@@ -4,11 +4,14 @@ Contains all required middleware classes in one file
 """
 
 import logging
+import re
+import time
 from datetime import datetime
+from logging.handlers import MemoryHandler, RotatingFileHandler
 import os
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponseForbidden
-from collections import defaultdict
 
 # 1. Request Logging Middleware
 class RequestLoggingMiddleware:
@@ -23,14 +26,24 @@ class RequestLoggingMiddleware:
         os.makedirs(logs_dir, exist_ok=True)
         
         if not self.logger.handlers:
-            file_handler = logging.FileHandler(os.path.join(logs_dir, 'requests.log'))
-            file_handler.setFormatter(logging.Formatter('%(message)s'))
-            self.logger.addHandler(file_handler)
+            file_handler = RotatingFileHandler(
+                os.path.join(logs_dir, 'requests.log'),
+                maxBytes=10 * 1024 * 1024,  # 10 MB per file
+                backupCount=5
+            )
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+            # Buffer records and write them in batches instead of once per request
+            self.logger.addHandler(
+                MemoryHandler(512, flushLevel=logging.ERROR, target=file_handler)
+            )
             self.logger.setLevel(logging.INFO)
+        
+        self._log = self.logger.info
     
     def __call__(self, request):
         user = request.user.username if request.user.is_authenticated else 'Anonymous'
-        self.logger.info(f"{datetime.now()} - User: {user} - Path: {request.path}")
+        # The record carries its own creation time; formatting is deferred to emit
+        self._log("User: %s - Path: %s", user, request.path)
         return self.get_response(request)
 
 # 2. Time Restriction Middleware
@@ -55,25 +68,29 @@ class OffensiveLanguageMiddleware:
     
     def __init__(self, get_response):
         self.get_response = get_response
-        self.request_counts = defaultdict(list)
         self.limit = 5  # 5 messages
         self.window = 60  # 1 minute in seconds
     
     def __call__(self, request):
         if request.method == 'POST':
             ip = request.META.get('REMOTE_ADDR')
-            now = datetime.now().timestamp()
-            
-            # Remove old timestamps
-            self.request_counts[ip] = [t for t in self.request_counts[ip] if now - t < self.window]
+            # Fixed window counter in the default cache. With the configured
+            # LocMemCache the limit is per process; point CACHES at a shared
+            # backend (Redis/Memcached) to enforce it across workers
+            key = f"rl:{ip}:{int(time.time() // self.window)}"
+            cache.add(key, 0, timeout=self.window)
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # Entry expired between add() and incr()
+                cache.set(key, 1, timeout=self.window)
+                count = 1
             
             # Check limit
-            if len(self.request_counts[ip]) >= self.limit:
+            if count > self.limit:
                 return HttpResponseForbidden(
                     "Message limit exceeded (5 per minute). Please wait."
                 )
-            
-            self.request_counts[ip].append(now)
         
         return self.get_response(request)
 
@@ -88,9 +105,12 @@ class RolepermissionMiddleware:
             '/moderate/',
             '/api/chat/delete/'
         ]
+        self._protected_re = re.compile(
+            "|".join(re.escape(path) for path in self.protected_paths)
+        )
     
     def __call__(self, request):
-        if any(request.path.startswith(path) for path in self.protected_paths):
+        if self._protected_re.match(request.path):
             if not request.user.is_authenticated:
                 return HttpResponseForbidden("Authentication required")
             
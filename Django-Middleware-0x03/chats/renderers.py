@@ -0,0 +1,30 @@
+# chats/renderers.py
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Fallback for types orjson cannot serialize itself
+_drf_default = JSONEncoder().default
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    Encodes the nested conversation/message payloads much faster than the
+    standard library json module used by DRF's JSONRenderer.
+    """
+    media_type = 'application/json'
+    format = 'json'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON bytes.
+        UUIDs and datetimes are encoded natively; anything else orjson does not
+        know (Decimal, sets, querysets, lazy translation strings) goes through
+        DRF's JSONEncoder.default, so it renders as it did with JSONRenderer.
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data, default=_drf_default, option=orjson.OPT_UTC_Z
+        )
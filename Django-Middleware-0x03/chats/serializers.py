@@ -6,12 +6,32 @@ from .models import Conversation, Message, MessageReadStatus
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserMiniSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for User model.
+    Used for nested participant lists; only needs the columns loaded by
+    the conversation participants prefetch.
+    """
+    full_name = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = User
+        fields = ['user_id', 'username', 'first_name', 'last_name', 'full_name']
+        read_only_fields = fields
+
+    def get_full_name(self, obj):
+        """Use the database-computed full_name annotation when the queryset has it"""
+        full_name = getattr(obj, 'full_name', None)
+        if full_name is not None:
+            return full_name
+        return obj.get_full_name()
+
+
+class UserSerializer(UserMiniSerializer):
     """
     Serializer for User model with basic information.
-    Used for nested relationships and user listings.
+    Used for user listings and the user endpoints.
     """
-    full_name = serializers.ReadOnlyField(source='get_full_name')
     username = serializers.CharField(max_length=150, read_only=True)
     email = serializers.CharField(max_length=254, read_only=True)
     first_name = serializers.CharField(max_length=150, read_only=True)
@@ -68,8 +88,9 @@ class MessageSerializer(serializers.ModelSerializer):
     Serializer for Message model.
     Includes sender information and reply handling.
     """
-    sender = UserSerializer(read_only=True)
-    sender_id = serializers.UUIDField(write_only=True)
+    # Flat sender fields instead of a nested UserSerializer per message
+    sender_username = serializers.CharField(source='sender.username', read_only=True)
+    sender_id = serializers.UUIDField()
     content = serializers.CharField(
         max_length=5000,
         min_length=1,
@@ -85,12 +106,12 @@ class MessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = Message
         fields = [
-            'message_id', 'sender', 'sender_id', 'conversation',
+            'message_id', 'sender_id', 'sender_username', 'conversation',
             'content', 'reply_to', 'reply_to_message', 'replies_count',
             'is_read', 'is_edited', 'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'message_id', 'sender', 'is_read', 'is_edited',
+            'message_id', 'sender_username', 'is_read', 'is_edited',
             'created_at', 'updated_at', 'replies_count'
         ]
     
@@ -149,7 +170,8 @@ class MessageCreateSerializer(serializers.ModelSerializer):
     Simplified serializer for creating messages.
     Used in nested conversation serializers.
     """
-    sender = UserSerializer(read_only=True)
+    sender_id = serializers.UUIDField(read_only=True)
+    sender_username = serializers.CharField(source='sender.username', read_only=True)
     content = serializers.CharField(
         max_length=5000,
         min_length=1,
@@ -159,10 +181,12 @@ class MessageCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Message
         fields = [
-            'message_id', 'sender', 'content', 'reply_to',
+            'message_id', 'sender_id', 'sender_username', 'content', 'reply_to',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['message_id', 'sender', 'created_at', 'updated_at']
+        read_only_fields = [
+            'message_id', 'sender_id', 'sender_username', 'created_at', 'updated_at'
+        ]
 
 
 class ConversationSerializer(serializers.ModelSerializer):
@@ -170,7 +194,7 @@ class ConversationSerializer(serializers.ModelSerializer):
     Basic serializer for Conversation model.
     Used for listing conversations without nested messages.
     """
-    participants = UserSerializer(many=True, read_only=True)
+    participants = UserMiniSerializer(many=True, read_only=True)
     participant_ids = serializers.ListField(
         child=serializers.UUIDField(),
         write_only=True,
@@ -199,6 +223,13 @@ class ConversationSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Resolve the requesting user once instead of once per conversation
+        request = self.context.get('request')
+        user = getattr(request, 'user', None)
+        self._current_user_pk = user.pk if user is not None and user.is_authenticated else None
+    
     def validate_title(self, value):
         """Validate conversation title"""
         if value and value.isspace():
@@ -209,21 +240,26 @@ class ConversationSerializer(serializers.ModelSerializer):
         """Get the latest message in the conversation"""
         latest_message = obj.get_latest_message()
         if latest_message:
+            body = latest_message.message_body
             return {
                 'message_id': latest_message.message_id,
                 'sender': latest_message.sender.username,
-                'content': latest_message.content[:100] + "..." if len(latest_message.content) > 100 else latest_message.content,
-                'created_at': latest_message.created_at
+                'content': body[:100] + "..." if len(body) > 100 else body,
+                'created_at': latest_message.sent_at
             }
         return None
     
     def get_unread_count(self, obj):
         """Get the number of unread messages for the current user"""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
+        # Annotated by ConversationViewSet for list views
+        unread_count = getattr(obj, 'unread_count', None)
+        if unread_count is not None:
+            return unread_count
+        user_pk = self._current_user_pk
+        if user_pk is not None:
             return obj.messages.filter(
                 is_read=False
-            ).exclude(sender=request.user).count()
+            ).exclude(sender_id=user_pk).count()
         return 0
     
     def validate_participant_ids(self, value):
@@ -286,7 +322,7 @@ class ConversationDetailSerializer(serializers.ModelSerializer):
     Detailed serializer for Conversation model.
     Includes nested messages and full participant information.
     """
-    participants = UserSerializer(many=True, read_only=True)
+    participants = UserMiniSerializer(many=True, read_only=True)
     participant_ids = serializers.ListField(
         child=serializers.UUIDField(),
         write_only=True,
@@ -317,8 +353,29 @@ class ConversationDetailSerializer(serializers.ModelSerializer):
     def get_messages(self, obj):
         """Get paginated messages for the conversation"""
         # Get latest 50 messages by default
-        messages = obj.messages.select_related('sender', 'reply_to__sender').order_by('-created_at')[:50]
-        return MessageSerializer(messages, many=True, context=self.context).data
+        messages = obj.messages.select_related('sender').order_by('-sent_at')[:50]
+        
+        request = self.context.get('request')
+        user_pk = request.user.pk if request else None
+        
+        # Built by hand rather than through MessageSerializer: this runs for up to
+        # 50 messages per conversation and needs no field binding or validation
+        return [
+            {
+                'message_id': message.message_id,
+                'sender_id': message.sender_id,
+                'sender_username': message.sender.username,
+                'conversation': obj.pk,
+                'content': message.message_body,
+                'reply_to': message.reply_to_id,
+                'is_read': message.is_read,
+                'is_edited': message.is_edited,
+                'is_own_message': message.sender_id == user_pk,
+                'created_at': message.sent_at,
+                'updated_at': message.updated_at,
+            }
+            for message in messages
+        ]
     
     def create(self, validated_data):
         """Create a new conversation with participants"""
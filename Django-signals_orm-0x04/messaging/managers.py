@@ -2,8 +2,11 @@
 from django.db import models
 
 class UnreadMessagesManager(models.Manager):
+    def unread_for_user(self, user):
+        return self.get_queryset().filter(receiver=user, read=False)
+
     def for_user(self, user):
-        return self.get_queryset().filter(receiver=user, read=False).only('id', 'content', 'sender', 'timestamp')
+        return self.unread_for_user(user).only('id', 'content', 'sender', 'timestamp')
 
 
 
@@ -1,7 +1,6 @@
-from django.db import models
+from django.db import connection, models
 from django.contrib.auth import get_user_model
 from django.db.models import Prefetch
-from .models import Message
 from .managers import UnreadMessagesManager
 
 
@@ -29,9 +28,57 @@ class Message(models.Model):
         related_name='replies'
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['parent_message', 'timestamp']),
+            models.Index(fields=['receiver', 'read']),
+            models.Index(fields=['receiver', '-timestamp']),
+        ]
+
     def __str__(self):
         return f"Message {self.id} from {self.sender}"
 
+    @classmethod
+    def thread_for(cls, root_id):
+        """
+        Fetch a message and all of its nested replies in a single query.
+        Each returned message carries a `depth` attribute (0 for the root).
+        """
+        table = cls._meta.db_table
+        return cls.objects.raw(
+            f"""
+            WITH RECURSIVE thread AS (
+                SELECT m.*, 0 AS depth FROM {table} m WHERE m.id = %s
+                UNION ALL
+                SELECT c.*, thread.depth + 1 FROM {table} c
+                JOIN thread ON c.parent_message_id = thread.id
+            )
+            SELECT * FROM thread ORDER BY depth, timestamp
+            """,
+            [root_id],
+        )
+
+    @classmethod
+    def ancestor_ids(cls, message_id):
+        """
+        Return the ids of a message and all of its ancestors in one query.
+        """
+        table = cls._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE ancestors AS (
+                    SELECT id, parent_message_id FROM {table} WHERE id = %s
+                    UNION ALL
+                    SELECT m.id, m.parent_message_id FROM {table} m
+                    JOIN ancestors ON m.id = ancestors.parent_message_id
+                )
+                SELECT id FROM ancestors
+                """,
+                [message_id],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
 
 class MessageHistory(models.Model):
     message = models.ForeignKey(Message, on_delete=models.CASCADE, related_name='history')
@@ -2,6 +2,7 @@ from django.db.models.signals import post_save, pre_save, post_delete
 from django.contrib.auth import get_user_model
 from django.dispatch import receiver
 from .models import Message, Notification, MessageHistory
+from .utils import invalidate_message_cache
 
 
 
@@ -39,6 +40,15 @@ def log_message_edit(sender, instance, **kwargs):
 
 
 
+@receiver(post_save, sender=Message)
+@receiver(post_delete, sender=Message)
+def invalidate_cached_message_pages(sender, instance, update_fields=None, **kwargs):
+    # Ancestor pages only render reply content, so saves that leave content
+    # untouched (e.g. the read flag) skip the thread walk
+    touches_thread = update_fields is None or 'content' in update_fields
+    invalidate_message_cache(instance, ancestors=touches_thread)
+
+
 @receiver(post_delete, sender=User)
 def cleanup_user_data(sender, instance, **kwargs):
     # Delete messages where user is either sender or receiver
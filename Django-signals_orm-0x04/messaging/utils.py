@@ -1,11 +1,80 @@
+import time
+from collections import defaultdict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
+from .models import Message
+
 
 def get_thread(message):
-    thread = []
+    """
+    Return the reply tree under `message` as (message, depth) tuples in
+    display order: each reply directly follows its parent, siblings by time.
+    """
+    messages = list(Message.thread_for(message.pk))
+    prefetch_related_objects(messages, 'sender')
 
-    def recurse(msg, depth=0):
-        thread.append((msg, depth))
-        for reply in msg.replies.all().select_related('sender'):
-            recurse(reply, depth + 1)
+    # Rows arrive ordered by depth then timestamp, so each child list is sorted
+    children = defaultdict(list)
+    for msg in messages[1:]:
+        children[msg.parent_message_id].append(msg)
 
-    recurse(message)
+    thread = []
+    stack = [(messages[0], 0)] if messages else []
+    while stack:
+        msg, depth = stack.pop()
+        thread.append((msg, depth))
+        for reply in reversed(children[msg.pk]):
+            stack.append((reply, depth + 1))
     return thread
+
+
+
+def message_cache_version(message_id):
+    return cache.get_or_set(f"message_{message_id}_version", time.time_ns, None)
+
+
+def invalidate_message_cache(message, ancestors=True):
+    """
+    Move a message, and by default every ancestor in its thread, to a new
+    cache version so cached pages that render that part of the thread are
+    no longer used.
+    """
+    message_ids = [message.pk]
+    if ancestors and message.parent_message_id:
+        message_ids += Message.ancestor_ids(message.parent_message_id)
+
+    version = time.time_ns()
+    cache.set_many(
+        {f"message_{pk}_version": version for pk in message_ids}, None
+    )
+
+
+def cache_message_view(timeout=60):
+    """
+    cache_page + vary_on_cookie with the message's cache version in the key
+    prefix, so signals can invalidate the page before the timeout. Varying
+    on the Cookie header keeps each session and CSRF token on its own entry.
+    Requests without a CSRF cookie are not cached, since their response
+    sets a fresh token the cached page would not match.
+    """
+    def decorator(view):
+        varied_view = vary_on_cookie(view)
+
+        @wraps(view)
+        def wrapper(request, message_id, *args, **kwargs):
+            if settings.CSRF_COOKIE_NAME not in request.COOKIES:
+                return varied_view(request, message_id, *args, **kwargs)
+            key_prefix = (
+                f"{view.__name__}_{message_id}_"
+                f"{message_cache_version(message_id)}"
+            )
+            cached_view = cache_page(timeout, key_prefix=key_prefix)(varied_view)
+            return cached_view(request, message_id, *args, **kwargs)
+        return wrapper
+    return decorator
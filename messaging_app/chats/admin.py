@@ -130,7 +130,11 @@ class MessageAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """Optimize queryset for admin list view"""
-        return super().get_queryset(request).select_related('sender', 'conversation')
+        # Conversation.__str__ reads the participants prefetch instead of
+        # running a slice and two count queries per row
+        return super().get_queryset(request).select_related(
+            'sender', 'conversation'
+        ).prefetch_related('conversation__participants')
 
 
 @admin.register(MessageReadStatus)
@@ -74,8 +74,10 @@ class User(AbstractUser):
 
     def get_full_name(self):
         """Return user's full name or username if names are not set"""
-        if self.first_name and self.last_name:
-            return f"{self.first_name} {self.last_name}"
+        first_name = self.first_name
+        last_name = self.last_name
+        if first_name and last_name:
+            return first_name + ' ' + last_name
         return self.username
 
     def save(self, *args, **kwargs):
@@ -172,6 +174,10 @@ class Conversation(models.Model):
 
     def get_latest_message(self):
         """Get the most recent message in this conversation"""
+        # Reuse the newest-first list prefetched by ConversationViewSet
+        recent_messages = getattr(self, 'recent_messages', None)
+        if recent_messages is not None:
+            return recent_messages[0] if recent_messages else None
         return self.messages.order_by('-sent_at').first()
 
     def add_participant(self, user):
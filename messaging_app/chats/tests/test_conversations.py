@@ -0,0 +1,44 @@
+# chats/tests/test_conversations.py
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework import status
+from chats.models import Conversation, Message
+
+User = get_user_model()
+
+
+class RecentConversationsTests(APITestCase):
+    """
+    Test the recent conversations endpoint
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='recentuser',
+            email='recent@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_latest_message_is_serialized(self):
+        """
+        Test that each conversation carries its newest message
+        """
+        conversation = Conversation.objects.create(
+            title="Recent", created_by=self.user
+        )
+        conversation.participants.set([self.user])
+        Message.objects.create(
+            conversation=conversation, sender=self.user, message_body="first"
+        )
+        latest = Message.objects.create(
+            conversation=conversation, sender=self.user, message_body="x" * 120
+        )
+
+        response = self.client.get('/api/recent/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        latest_message = response.data[0]['latest_message']
+        self.assertEqual(latest_message['message_id'], latest.message_id)
+        self.assertEqual(latest_message['sender'], 'recentuser')
+        self.assertEqual(latest_message['content'], "x" * 100 + "...")
@@ -4,7 +4,11 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count
+from django.db.models import (
+    Q, Count, Prefetch, Case, When, F, Value, CharField, IntegerField,
+    OuterRef, Subquery,
+)
+from django.db.models.functions import Coalesce, Concat
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
@@ -39,6 +43,60 @@ from .filters import ConversationFilter, MessageFilter, UserFilter
 User = get_user_model()
 
 
+def with_full_name(queryset):
+    """
+    Annotate users with full_name computed by the database.
+    Mirrors User.get_full_name(): falls back to the username unless both
+    first and last name are set.
+    """
+    return queryset.annotate(
+        full_name=Case(
+            When(Q(first_name='') | Q(last_name=''), then=F('username')),
+            default=Concat('first_name', Value(' '), 'last_name'),
+            output_field=CharField(),
+        )
+    )
+
+
+def participants_prefetch():
+    """Prefetch participants with only the columns UserMiniSerializer reads"""
+    return Prefetch(
+        'participants',
+        queryset=with_full_name(
+            User.objects.only('user_id', 'username', 'first_name', 'last_name')
+        )
+    )
+
+
+def latest_message_prefetch():
+    """
+    Prefetch only each conversation's newest message into recent_messages,
+    so list views never load a conversation's full history
+    """
+    newest = Message.objects.filter(
+        conversation=OuterRef('conversation')
+    ).order_by('-sent_at').values('message_id')[:1]
+    return Prefetch(
+        'messages',
+        queryset=Message.objects.select_related('sender').filter(
+            message_id=Subquery(newest)
+        ),
+        to_attr='recent_messages'
+    )
+
+
+def with_unread_count(queryset, user):
+    """Annotate conversations with the user's unread message count"""
+    unread = Message.objects.filter(
+        conversation=OuterRef('pk'), is_read=False
+    ).exclude(sender=user).order_by().values('conversation').annotate(
+        count=Count('pk')
+    ).values('count')
+    return queryset.annotate(
+        unread_count=Coalesce(Subquery(unread, output_field=IntegerField()), 0)
+    )
+
+
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
@@ -56,11 +114,18 @@ class ConversationViewSet(viewsets.ModelViewSet):
     ordering = ['-updated_at']
 
     def get_queryset(self):
-        return Conversation.objects.filter(
+        queryset = Conversation.objects.filter(
             participants=self.request.user
         ).select_related('created_by').prefetch_related(
-            'participants', 'messages__sender'
+            participants_prefetch()
         ).annotate(participant_count=Count('participants')).order_by('-updated_at')
+        if self.action == 'list':
+            # Detail views load their messages with a LIMIT query instead
+            queryset = with_unread_count(
+                queryset.prefetch_related(latest_message_prefetch()),
+                self.request.user
+            )
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -239,7 +304,11 @@ class MessageViewSet(viewsets.ModelViewSet):
         if not conversation:
             return Response({'error': 'Conversation is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if not conversation.participants.filter(user_id=request.user.user_id).exists():
+        # Single lookup on the participants join table's (conversation, user) unique index
+        is_participant = Conversation.participants.through.objects.filter(
+            conversation_id=conversation.pk, user_id=request.user.pk
+        ).exists()
+        if not is_participant:
             return Response({'error': 'Not a participant'}, status=status.HTTP_403_FORBIDDEN)
 
         conversation.updated_at = timezone.now()
@@ -358,7 +427,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-date_joined']
 
     def get_queryset(self):
-        return User.objects.all()
+        return with_full_name(User.objects.all())
 
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -370,9 +439,9 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
 @permission_classes([permissions.IsAuthenticated])
 def search_users(request):
     query = request.query_params.get('q', '')
-    users = User.objects.filter(
+    users = with_full_name(User.objects.filter(
         Q(username__icontains=query) | Q(email__icontains=query)
-    )
+    ))
     serializer = UserSerializer(users, many=True)
     return Response(serializer.data)
 
@@ -397,6 +466,8 @@ def conversation_statistics(request):
 def recent_conversations(request):
     conversations = Conversation.objects.filter(
         participants=request.user
+    ).prefetch_related(
+        participants_prefetch(), latest_message_prefetch()
     ).order_by('-updated_at')[:10]
     serializer = ConversationSerializer(conversations, many=True)
     return Response(serializer.data)
@@ -14,9 +14,12 @@ A robust database seeding utility with:
 import csv
 import logging
 import os
+import re
+import tempfile
 import uuid
 from contextlib import contextmanager
-from typing import Iterator, Dict, Any, List, Tuple, Union, Optional
+from itertools import chain
+from typing import Iterable, Iterator, Dict, Any, List, Tuple, Union, Optional
 
 import mysql.connector
 from mysql.connector import Error, pooling
@@ -36,6 +39,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once; used for every row in the validation loop
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
 
 class DatabaseConfig:
     """Database configuration with environment variables and defaults"""
@@ -66,7 +72,9 @@ class DatabaseManager:
                     password=DatabaseConfig.PASSWORD,
                     database=DatabaseConfig.DATABASE,
                     port=DatabaseConfig.PORT,
-                    autocommit=True
+                    autocommit=False,  # seeding commits once per load
+                    allow_local_infile=True,
+                    use_pure=False  # C extension protocol implementation
                 )
                 logger.info("Database connection pool initialized")
             except Error as e:
@@ -92,107 +100,123 @@ class DatabaseManager:
                 connection.close()
 
 
-def create_database() -> bool:
+def create_database(cursor) -> bool:
     """Create the database if it doesn't exist"""
     try:
-        with DatabaseManager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SHOW DATABASES LIKE %s", (DatabaseConfig.DATABASE,))
-            
-            if cursor.fetchone():
-                logger.info(f"Database {DatabaseConfig.DATABASE} already exists")
-                return True
-                
-            cursor.execute(
-                f"CREATE DATABASE {DatabaseConfig.DATABASE} "
-                f"CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
-            )
-            logger.info(f"Database {DatabaseConfig.DATABASE} created successfully")
+        cursor.execute("SHOW DATABASES LIKE %s", (DatabaseConfig.DATABASE,))
+        
+        if cursor.fetchone():
+            logger.info(f"Database {DatabaseConfig.DATABASE} already exists")
             return True
             
+        cursor.execute(
+            f"CREATE DATABASE {DatabaseConfig.DATABASE} "
+            f"CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"
+        )
+        logger.info(f"Database {DatabaseConfig.DATABASE} created successfully")
+        return True
+            
     except Error as e:
         logger.error(f"Error creating database: {e}")
         return False
 
 
-def create_table() -> bool:
+def create_table(cursor) -> bool:
     """Create the user_data table if it doesn't exist"""
     try:
-        with DatabaseManager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*)
-                FROM information_schema.tables
-                WHERE table_schema = %s
-                AND table_name = 'user_data'
-            """, (DatabaseConfig.DATABASE,))
-            
-            if cursor.fetchone()[0] > 0:
-                logger.info("Table user_data already exists")
-                return True
-                
-            create_table_query = """
-            CREATE TABLE user_data (
-                user_id CHAR(36) PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL UNIQUE,
-                age TINYINT UNSIGNED NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                INDEX idx_email (email),
-                INDEX idx_age (age),
-                INDEX idx_created_at (created_at)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """
-            cursor.execute(create_table_query)
-            logger.info("Table user_data created successfully")
+        cursor.execute("""
+            SELECT COUNT(*)
+            FROM information_schema.tables
+            WHERE table_schema = %s
+            AND table_name = 'user_data'
+        """, (DatabaseConfig.DATABASE,))
+        
+        if cursor.fetchone()[0] > 0:
+            logger.info("Table user_data already exists")
             return True
             
+        create_table_query = """
+        CREATE TABLE user_data (
+            user_id CHAR(36) PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            email VARCHAR(255) NOT NULL UNIQUE,
+            age TINYINT UNSIGNED NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            INDEX idx_email (email),
+            INDEX idx_age (age),
+            INDEX idx_created_at (created_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """
+        cursor.execute(create_table_query)
+        logger.info("Table user_data created successfully")
+        return True
+        
     except Error as e:
         logger.error(f"Error creating table: {e}")
         return False
 
 
-def validate_user_data(row: Dict[str, Any]) -> bool:
-    """Validate user data before insertion"""
-    try:
-        if not isinstance(row.get('name'), str) or not row['name'].strip():
-            return False
-            
-        if not isinstance(row.get('email'), str) or '@' not in row['email']:
-            return False
-            
-        age = int(row.get('age', 0))
-        if not (0 < age <= 120):  # Reasonable age range
-            return False
-            
-        return True
-    except (ValueError, TypeError):
+def validate_user_data(name: str, email: str, age: int) -> bool:
+    """Validate cleaned user fields before insertion"""
+    if not name:
         return False
+        
+    if not _EMAIL_RE.match(email):
+        return False
+        
+    return 0 < age <= 120  # Reasonable age range
+
+
+def clean_user_record(user_id: Optional[str], name: Any, email: Any,
+                      age: Any) -> Tuple[str, str, str, int]:
+    """Normalize and validate a single user record"""
+    record = (
+        user_id or str(uuid.uuid4()),
+        str(name).strip(),
+        str(email).strip().lower(),
+        int(float(age))
+    )
+    
+    if not validate_user_data(*record[1:]):
+        raise ValueError(f"Invalid user data: {record}")
+        
+    return record
 
 
 def process_row(row: Dict[str, Any]) -> Tuple[str, str, str, int]:
     """Process and validate a row of user data"""
-    row['user_id'] = row.get('user_id') or str(uuid.uuid4())
-    row['name'] = str(row.get('name', '')).strip()
-    row['email'] = str(row.get('email', '')).strip().lower()
-    row['age'] = int(float(row.get('age', 0)))
-    
-    if not validate_user_data(row):
-        raise ValueError(f"Invalid user data: {row}")
-        
-    return (row['user_id'], row['name'], row['email'], row['age'])
+    return clean_user_record(
+        row.get('user_id'), row.get('name', ''),
+        row.get('email', ''), row.get('age', 0)
+    )
 
 
-def csv_reader_generator(file_path: str) -> Iterator[Dict[str, Any]]:
+def csv_reader_generator(file_path: str) -> Iterator[Tuple[str, str, str, int]]:
     """Generate user data from CSV file with validation"""
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
+            csv_reader = csv.reader(file)
+            header = next(csv_reader, [])
+            # Resolve column positions once; rows are plain lists, not dicts
+            columns = {name: i for i, name in enumerate(header)}
+            missing = [c for c in ('name', 'email', 'age') if c not in columns]
+            if missing:
+                logger.error(f"CSV file {file_path} is missing columns: {missing}")
+                return
+            user_id_idx = columns.get('user_id')
+            name_idx, email_idx, age_idx = (
+                columns['name'], columns['email'], columns['age']
+            )
             for row in csv_reader:
+                if not row:
+                    continue  # blank line
                 try:
-                    yield process_row(row)
-                except ValueError as e:
+                    yield clean_user_record(
+                        row[user_id_idx] if user_id_idx is not None else None,
+                        row[name_idx], row[email_idx], row[age_idx]
+                    )
+                except (ValueError, IndexError) as e:
                     logger.warning(f"Skipping invalid row: {e}")
     except FileNotFoundError:
         logger.error(f"CSV file not found: {file_path}")
@@ -202,64 +226,210 @@ def csv_reader_generator(file_path: str) -> Iterator[Dict[str, Any]]:
         raise
 
 
-def insert_data(data: Union[str, List[Dict[str, Any]]], batch_size: int = 1000) -> int:
+def bulk_uuids(n: int) -> List[str]:
+    """Generate n random (version 4) UUID strings from a single urandom call"""
+    raw = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, 16 * n, 16)
+    ]
+
+
+def load_csv_vectorized(file_path: str) -> List[Tuple[str, str, str, int]]:
+    """
+    Load, clean and validate a user CSV with column-wise pandas operations.
+
+    Applies the same rules as process_row/validate_user_data, but over whole
+    columns instead of one row at a time. Requires pandas; raises ValueError
+    if a required column is missing.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = pd.read_csv(
+        file_path,
+        usecols=['user_id', 'name', 'email', 'age'],
+        dtype={'user_id': 'string', 'name': 'string', 'email': 'string'},
+        # Only empty cells are missing; keep values like "NA" or "None" as
+        # text, the way csv_reader_generator does
+        keep_default_na=False,
+        na_values=['']
+    )
+    names = df['name'].str.strip()
+    emails = df['email'].str.strip().str.lower()
+    ages = np.trunc(pd.to_numeric(df['age'], errors='coerce').to_numpy(dtype=float))
+
+    mask = (
+        names.str.len().gt(0)
+        & emails.str.match(_EMAIL_RE.pattern)
+    ).fillna(False).to_numpy(dtype=bool) & valid_age_mask(ages)
+
+    skipped = len(df) - int(mask.sum())
+    if skipped:
+        logger.warning(f"Skipping {skipped} invalid rows")
+
+    user_ids = df.loc[mask, 'user_id'].fillna('')
+    missing = user_ids.eq('')
+    user_ids[missing] = bulk_uuids(int(missing.sum()))
+
+    return list(zip(
+        user_ids.tolist(),
+        names[mask].tolist(),
+        emails[mask].tolist(),
+        ages[mask].astype(int).tolist()
+    ))
+
+
+def valid_age_mask(ages):
+    """
+    Boolean mask of ages inside the accepted (0, 120] range.
+
+    Operates on a NumPy float array in one compiled pass; NaN (unparseable
+    ages) compares False and is rejected.
+    """
+    return (ages > 0) & (ages <= 120)
+
+
+def insert_batch(cursor, batch: List[Tuple[str, str, str, int]]) -> None:
+    """Upsert a batch of records with a single multi-row INSERT statement"""
+    values = ", ".join(["(%s, %s, %s, %s)"] * len(batch))
+    cursor.execute(
+        f"INSERT INTO user_data (user_id, name, email, age) VALUES {values} "
+        "ON DUPLICATE KEY UPDATE "
+        "name = VALUES(name), email = VALUES(email), age = VALUES(age)",
+        tuple(chain.from_iterable(batch))
+    )
+
+
+def load_data_infile(cursor, records: Iterable[Tuple[str, str, str, int]]) -> int:
+    """
+    Bulk load validated records with LOAD DATA LOCAL INFILE.
+
+    Records may be any iterable, including a generator; they are written to
+    the temporary CSV one at a time and counted on the way.
+    LOAD DATA cannot express ON DUPLICATE KEY UPDATE, so rows are streamed
+    into a temporary staging table and upserted from there in one statement.
+    Raises mysql.connector.Error if the server disallows local infile.
+    """
+    count = 0
+    with tempfile.NamedTemporaryFile(
+        'w', suffix='.csv', newline='', encoding='utf-8', delete=False
+    ) as tmp:
+        writer = csv.writer(tmp, lineterminator='\n')
+        for record in records:
+            writer.writerow(record)
+            count += 1
+        tmp_path = tmp.name
+
+    try:
+        cursor.execute("""
+            CREATE TEMPORARY TABLE IF NOT EXISTS user_data_stage (
+                user_id CHAR(36) NOT NULL,
+                name VARCHAR(255) NOT NULL,
+                email VARCHAR(255) NOT NULL,
+                age TINYINT UNSIGNED NOT NULL
+            )
+        """)
+        cursor.execute("TRUNCATE TABLE user_data_stage")
+        cursor.execute("""
+            LOAD DATA LOCAL INFILE %s INTO TABLE user_data_stage
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+            LINES TERMINATED BY '\\n'
+            (user_id, name, email, age)
+        """, (tmp_path,))
+        cursor.execute("""
+            INSERT INTO user_data (user_id, name, email, age)
+            SELECT user_id, name, email, age FROM user_data_stage
+            ON DUPLICATE KEY UPDATE
+                name = VALUES(name),
+                email = VALUES(email),
+                age = VALUES(age)
+        """)
+        cursor.execute("DROP TEMPORARY TABLE user_data_stage")
+        return count
+    finally:
+        os.unlink(tmp_path)
+
+
+def insert_data(conn, data: Union[str, List[Dict[str, Any]]],
+                batch_size: int = 1000) -> int:
     """
     Insert or update data in the user_data table
     
+    All rows are written in a single transaction, committed once at the end
+    and rolled back as a whole on error.
+    
     Args:
+        conn: Open connection with autocommit disabled
         data: Either a CSV file path or a list of dictionaries
         batch_size: Number of records to insert per batch
         
     Returns:
         int: Number of successfully inserted records
     """
-    insert_query = """
-    INSERT INTO user_data (user_id, name, email, age)
-    VALUES (%s, %s, %s, %s)
-    ON DUPLICATE KEY UPDATE
-        name = VALUES(name),
-        email = VALUES(email),
-        age = VALUES(age)
-    """
-    
     total_inserted = 0
+    cursor = conn.cursor()
     
     try:
-        with DatabaseManager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Handle CSV file input
-            if isinstance(data, str):
-                if not os.path.exists(data):
-                    logger.info(f"CSV file {data} not found. Creating sample data...")
-                    create_sample_csv(data)
-                data = csv_reader_generator(data)
-            
-            # Handle list of dictionaries
-            elif isinstance(data, list) and data and isinstance(data[0], dict):
-                data = (process_row(row) for row in data)
-            
-            # Batch processing
-            batch = []
-            for record in data:
-                batch.append(record)
-                if len(batch) >= batch_size:
-                    cursor.executemany(insert_query, batch)
-                    total_inserted += len(batch)
-                    batch = []
-                    logger.debug(f"Inserted {total_inserted} records so far...")
+        # Handle CSV file input
+        if isinstance(data, str):
+            csv_path = data
+            if not os.path.exists(csv_path):
+                logger.info(f"CSV file {csv_path} not found. Creating sample data...")
+                create_sample_csv(csv_path)
+            try:
+                data = load_csv_vectorized(csv_path)
+            except (ImportError, ValueError):
+                # Stream rows from the file rather than holding them all
+                data = csv_reader_generator(csv_path)
             
-            # Insert remaining records
-            if batch:
-                cursor.executemany(insert_query, batch)
+            try:
+                conn.start_transaction()
+                total_inserted = load_data_infile(cursor, data)
+                conn.commit()
+                logger.info(f"Successfully inserted/updated {total_inserted} records")
+                return total_inserted
+            except Error as e:
+                conn.rollback()
+                logger.warning(
+                    f"LOAD DATA LOCAL INFILE unavailable ({e}); "
+                    f"falling back to batched inserts"
+                )
+                if not isinstance(data, list):
+                    # The failed load consumed the generator; read the file again
+                    data = csv_reader_generator(csv_path)
+        
+        # Handle list of dictionaries
+        elif isinstance(data, list) and data and isinstance(data[0], dict):
+            data = (process_row(row) for row in data)
+        
+        # Batch processing
+        conn.start_transaction()
+        batch = []
+        for record in data:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                insert_batch(cursor, batch)
                 total_inserted += len(batch)
-            
-            logger.info(f"Successfully inserted/updated {total_inserted} records")
-            return total_inserted
-            
+                batch = []
+                logger.debug(f"Inserted {total_inserted} records so far...")
+        
+        # Insert remaining records
+        if batch:
+            insert_batch(cursor, batch)
+            total_inserted += len(batch)
+        
+        conn.commit()
+        logger.info(f"Successfully inserted/updated {total_inserted} records")
+        return total_inserted
+        
     except Error as e:
+        conn.rollback()
         logger.error(f"Error inserting data: {e}")
         return 0
+    finally:
+        cursor.close()
 
 
 def create_sample_csv(file_path: str = "user_data.csv", num_records: int = 1000):
@@ -283,21 +453,40 @@ def create_sample_csv(file_path: str = "user_data.csv", num_records: int = 1000)
     logger.info(f"Created sample CSV with {num_records} records at {file_path}")
 
 
-def stream_all_users(batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
-    """Stream all users from the database in batches"""
+def run_setup(conn, csv_path: str = "user_data.csv") -> int:
+    """Create the database and table, then seed them, on one connection"""
+    cursor = conn.cursor()
+    try:
+        create_database(cursor)
+        create_table(cursor)
+    finally:
+        cursor.close()
+    # End the read transaction opened by the existence checks so the seed
+    # can start its own
+    conn.commit()
+    return insert_data(conn, csv_path)
+
+
+def stream_all_users() -> Iterator[Dict[str, Any]]:
+    """Stream all users from the database one row at a time"""
     query = "SELECT * FROM user_data ORDER BY created_at DESC"
     
     try:
         with DatabaseManager.get_connection() as conn:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            
-            while True:
-                rows = cursor.fetchmany(batch_size)
-                if not rows:
-                    break
-                for row in rows:
+            # Give slow consumers time before the server drops the stream
+            conn.cmd_query("SET SESSION net_write_timeout = 600")
+            # Unbuffered: rows are read from the server as they are consumed
+            # instead of materializing the whole result set up front
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query)
+                for row in cursor:
                     yield row
+            finally:
+                # A caller that stops early leaves rows unread; drain them so
+                # the connection can be returned to the pool
+                conn.consume_results()
+                cursor.close()
     except Error as e:
         logger.error(f"Error streaming users: {e}")
         raise
@@ -308,12 +497,9 @@ def main():
     try:
         logger.info("Starting database setup...")
         
-        # Initialize database
-        create_database()
-        create_table()
-        
-        # Seed data
-        inserted = insert_data("user_data.csv")
+        # One pooled connection for the whole setup
+        with DatabaseManager.get_connection() as conn:
+            inserted = run_setup(conn)
         logger.info(f"Total records processed: {inserted}")
         
         # Example of streaming users